@@ -6,9 +6,158 @@ Copies the skill to ~/.claude/skills/ for Claude Code to discover
 
 import os
 import sys
+import stat
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Buffer size for the portable read/write fallback
+COPY_BUFSIZE = 1 << 20
+
+
+def _copy_fd_native(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy file contents with a zero-copy syscall, return False if unavailable"""
+    if sys.platform == "darwin":
+        try:
+            import posix
+            posix._fcopyfile(src_fd, dst_fd, posix._COPYFILE_DATA)
+            return True
+        except (ImportError, AttributeError, OSError):
+            return False
+
+    if sys.platform.startswith("linux"):
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return True
+        except OSError:
+            # Filesystem doesn't support sendfile, start over in userspace
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+            return False
+
+    return False
+
+
+def _copy_fd_buffered(src_fd: int, dst_fd: int) -> None:
+    """Copy file contents through a single reusable buffer"""
+    with open(src_fd, "rb", buffering=0, closefd=False) as fsrc, \
+            open(dst_fd, "wb", closefd=False) as fdst, \
+            memoryview(bytearray(COPY_BUFSIZE)) as buf:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(buf[:n])
+
+
+def _copy_file_windows(src: str, dst: str) -> bool:
+    """Copy a file with the Win32 CopyFile2 API, return False on failure"""
+    try:
+        import ctypes
+        copy_file2 = ctypes.windll.kernel32.CopyFile2
+        copy_file2.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p]
+        copy_file2.restype = ctypes.c_long
+    except (ImportError, AttributeError):
+        return False
+    return copy_file2(src, dst, None) >= 0
+
+
+def _copy_file(src: str, dst: str, st: os.stat_result) -> None:
+    """Copy a single file using the fastest method the platform offers"""
+    if not (os.name == 'nt' and _copy_file_windows(src, dst)):
+        binary = getattr(os, "O_BINARY", 0)
+        src_fd = os.open(src, os.O_RDONLY | binary)
+        try:
+            # Hint a one-shot sequential read so the kernel reads ahead
+            # and can drop the pages afterwards
+            fadvise = getattr(os, "posix_fadvise", None)
+            if fadvise:
+                fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                fadvise(src_fd, 0, 0, os.POSIX_FADV_WILLNEED)
+
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o666)
+            try:
+                if not _copy_fd_native(src_fd, dst_fd, st.st_size):
+                    _copy_fd_buffered(src_fd, dst_fd)
+            finally:
+                os.close(dst_fd)
+
+            if fadvise:
+                fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(src_fd)
+
+    # Preserve permissions and timestamps like shutil.copy2
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _collect_tree(src: str, dst: str, dirs: list, pairs: list) -> None:
+    """Walk src with os.scandir, gathering target dirs and (src, dst, stat) file tuples"""
+    dirs.append(dst)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            # Symlinks are followed like shutil.copytree; for regular entries
+            # the stat result is served from the scandir cache
+            if entry.is_dir():
+                _collect_tree(entry.path, target, dirs, pairs)
+            else:
+                pairs.append((entry.path, target, entry.stat()))
+
+
+def _copy_one(pair: tuple) -> None:
+    """Copy a single (src, dst, stat) tuple, used as the thread pool worker"""
+    _copy_file(*pair)
+
+
+def _needs_copy(st: os.stat_result, old) -> bool:
+    """Compare a source stat with the target's; _copy_file preserves mtimes"""
+    return old is None or old.st_size != st.st_size or old.st_mtime_ns != st.st_mtime_ns
+
+
+def _scan_and_prune(dst: str, wanted_dirs: set, wanted_files: set, existing: dict) -> None:
+    """Record stats of files already in dst and delete entries absent from src"""
+    with os.scandir(dst) as it:
+        for entry in it:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir and entry.path in wanted_dirs:
+                _scan_and_prune(entry.path, wanted_dirs, wanted_files, existing)
+            elif not is_dir and entry.path in wanted_files:
+                existing[entry.path] = entry.stat(follow_symlinks=False)
+            elif is_dir:
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def _sync_tree(src: Path, dst: Path) -> int:
+    """Mirror src into dst, copying only files whose size or mtime differ"""
+    dirs, pairs = [], []
+    _collect_tree(str(src), str(dst), dirs, pairs)
+
+    existing = {}
+    if os.path.isdir(dst):
+        _scan_and_prune(str(dst), set(dirs), {p[1] for p in pairs}, existing)
+
+    # Create all directories up front so workers never race on mkdir
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
+
+    stale = [pair for pair in pairs if _needs_copy(pair[2], existing.get(pair[1]))]
+
+    # File copies are I/O bound and release the GIL, so threads overlap well
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(_copy_one, stale))
+
+    return len(stale)
+
 
 def main():
     # Get paths
@@ -34,21 +183,31 @@ def main():
         "scripts",
     ]
 
+    # One scandir of the source gives type and stat for every item
+    with os.scandir(current_dir) as it:
+        entries = {entry.name: entry for entry in it}
+
     # Copy files
     for item in files_to_copy:
-        src = current_dir / item
+        entry = entries.get(item)
         dst = target_dir / item
 
-        if src.is_dir():
-            if dst.exists():
-                shutil.rmtree(dst)
-            shutil.copytree(src, dst)
-            print(f"   ✅ Copied: {item}/")
-        elif src.exists():
-            shutil.copy2(src, dst)
-            print(f"   ✅ Copied: {item}")
-        else:
+        if entry is None:
             print(f"   ⚠️  Skipped: {item} (not found)")
+        elif entry.is_dir():
+            updated = _sync_tree(Path(entry.path), dst)
+            print(f"   ✅ Copied: {item}/ ({updated} updated)")
+        else:
+            st = entry.stat()
+            try:
+                old = os.stat(dst)
+            except FileNotFoundError:
+                old = None
+            if _needs_copy(st, old):
+                _copy_file(entry.path, str(dst), st)
+                print(f"   ✅ Copied: {item}")
+            else:
+                print(f"   ✅ Unchanged: {item}")
 
     # Make scripts executable
     scripts_dir = target_dir / "scripts"
@@ -0,0 +1,34 @@
+"""
+Output formatting helpers for transcribe.py
+
+Kept free of other imports and fully annotated so this module can be
+compiled ahead of time with mypyc (see README). Python picks up the
+compiled extension automatically when present, otherwise this file runs.
+"""
+
+
+def format_timestamp(seconds: float) -> str:
+    """Format timestamp as HH:MM:SS.mmm"""
+    minutes, secs = divmod(seconds, 60.0)
+    hours, mins = divmod(int(minutes), 60)
+    return f"{hours:02d}:{mins:02d}:{secs:06.3f}"
+
+
+def format_timestamp_srt(seconds: float) -> str:
+    """Format timestamp as SRT format HH:MM:SS,mmm"""
+    # One float op, then integer divmods (truncates like the float version)
+    whole = int(seconds)
+    millis = int((seconds - whole) * 1000)
+    minutes, secs = divmod(whole, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def format_text_line(start: float, end: float, text: str) -> str:
+    """Format one segment as a timestamped text line"""
+    return f"[{start:.2f}s -> {end:.2f}s] {text}\n"
+
+
+def format_srt_entry(index: int, start: float, end: float, text: str) -> str:
+    """Format one segment as an SRT subtitle block"""
+    return f"{index}\n{format_timestamp_srt(start)} --> {format_timestamp_srt(end)}\n{text}\n\n"
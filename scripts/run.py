@@ -5,8 +5,10 @@ Ensures all scripts run with the correct virtual environment
 Zero configuration required - everything is automatic
 """
 
+import importlib.util
 import os
 import sys
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -24,12 +26,29 @@ def get_venv_python():
     return venv_python
 
 
+def host_has_dependencies():
+    """Check if the current Python can already import faster-whisper"""
+    if sys.version_info < (3, 9):
+        return False
+    return importlib.util.find_spec("faster_whisper") is not None
+
+
+def has_inline_metadata(script_path):
+    """Check if a script declares its dependencies with a PEP 723 header"""
+    with open(script_path, encoding="utf-8") as f:
+        return any(line.rstrip() == "# /// script" for line in f)
+
+
 def ensure_venv():
     """Ensure virtual environment exists and is set up"""
     skill_dir = Path(__file__).parent.parent
     venv_dir = skill_dir / ".venv"
     setup_script = skill_dir / "scripts" / "setup_environment.py"
 
+    # No venv needed when the host interpreter has everything installed
+    if not venv_dir.exists() and host_has_dependencies():
+        return Path(sys.executable)
+
     # Check if venv exists
     if not venv_dir.exists():
         print("🔧 First-time setup: Creating virtual environment...")
@@ -79,14 +98,23 @@ def main():
         print(f"   Looked for: {script_path}")
         sys.exit(1)
 
-    # Ensure venv exists and get Python executable
-    venv_python = ensure_venv()
-
-    # Build command
-    cmd = [str(venv_python), str(script_path)] + script_args
+    # Without a usable environment, let uv build one from the script's
+    # inline metadata using its shared global cache
+    uv = shutil.which("uv")
+    use_uv = bool(uv and not get_venv_python().exists() and not host_has_dependencies()
+                  and has_inline_metadata(script_path))
+    if use_uv:
+        cmd = [uv, "run", "--script", str(script_path)] + script_args
+    else:
+        # Ensure venv exists and get Python executable
+        venv_python = ensure_venv()
+        cmd = [str(venv_python), str(script_path)] + script_args
 
     # Run the script
     try:
+        if use_uv and os.name != 'nt':
+            # Hand the process over to uv instead of waiting on a child
+            os.execv(uv, cmd)
         result = subprocess.run(cmd)
         sys.exit(result.returncode)
     except KeyboardInterrupt:
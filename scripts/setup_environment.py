@@ -5,12 +5,57 @@ Manages virtual environment and dependencies automatically
 Zero configuration required
 """
 
+import hashlib
+import importlib.util
 import os
 import sys
+import shutil
 import subprocess
+import sysconfig
+import urllib.request
 import venv
 from pathlib import Path
 
+GET_PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
+
+# ioctl request for reflink copies on btrfs/xfs (linux/fs.h)
+FICLONE = 0x40049409
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """Share file data via hardlink or reflink, copying only as a last resort"""
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
+
+
+def _clone_tree(src: str, dst: str) -> None:
+    """Recursively materialize src at dst without duplicating file data"""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir(follow_symlinks=False):
+                _clone_tree(entry.path, target)
+            else:
+                _clone_file(entry.path, target)
+
 
 class SkillEnvironment:
     """Manages skill-specific virtual environment"""
@@ -21,13 +66,33 @@ class SkillEnvironment:
         self.venv_dir = self.skill_dir / ".venv"
         self.requirements_file = self.skill_dir / "requirements.txt"
 
+        # Shared cache of downloaded wheels and packages, reused across skill
+        # installs. Both are interpreter/platform specific, so key them by ABI
+        self.cache_dir = Path.home() / ".cache" / "skill-faster-whisper"
+        self.abi_tag = f"{sys.implementation.cache_tag}-{sysconfig.get_platform()}"
+        self.wheels_dir = self.cache_dir / "wheels" / self.abi_tag
+        self.get_pip = self.cache_dir / "get-pip.py"
+
+        # Set when the host interpreter is used instead of a venv
+        self.uses_host_python = False
+
         # Python executable in venv
         if os.name == 'nt':  # Windows
             self.venv_python = self.venv_dir / "Scripts" / "python.exe"
-            self.venv_pip = self.venv_dir / "Scripts" / "pip.exe"
         else:  # Unix/Linux/Mac
             self.venv_python = self.venv_dir / "bin" / "python"
-            self.venv_pip = self.venv_dir / "bin" / "pip"
+
+    @property
+    def site_packages(self) -> Path:
+        """site-packages directory inside the skill venv"""
+        if os.name == 'nt':
+            return self.venv_dir / "Lib" / "site-packages"
+        version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+        return self.venv_dir / "lib" / version / "site-packages"
+
+    def golden_dir(self, req_hash: str) -> Path:
+        """Cached site-packages snapshot for this interpreter and requirements"""
+        return self.cache_dir / f"venv-{self.abi_tag}-{req_hash[:16]}"
 
     def ensure_venv(self) -> bool:
         """Ensure virtual environment exists and is set up"""
@@ -37,11 +102,18 @@ class SkillEnvironment:
             print("✅ Already running in skill virtual environment")
             return True
 
+        # The host interpreter may already provide everything we need
+        if self.host_has_dependencies():
+            print("✅ Host Python already provides faster-whisper, skipping venv")
+            self.venv_python = Path(sys.executable)
+            self.uses_host_python = True
+            return True
+
         # Create venv if it doesn't exist
         if not self.venv_dir.exists():
             print(f"🔧 Creating virtual environment in {self.venv_dir.name}/")
             try:
-                venv.create(self.venv_dir, with_pip=True)
+                self.create_venv()
                 print("✅ Virtual environment created")
             except Exception as e:
                 print(f"❌ Failed to create venv: {e}")
@@ -49,33 +121,139 @@ class SkillEnvironment:
 
         # Install/update dependencies
         if self.requirements_file.exists():
+            req_hash = self.requirements_hash()
+            installed_marker = self.venv_dir / ".requirements-hash"
+            if installed_marker.exists() and installed_marker.read_text().strip() == req_hash:
+                print("✅ Dependencies already installed")
+                return True
+
+            # Reuse packages from a previous install with identical requirements
+            golden = self.golden_dir(req_hash)
+            if golden.exists():
+                print(f"♻️  Linking cached packages from {golden}")
+                try:
+                    shutil.rmtree(self.site_packages)
+                    _clone_tree(str(golden), str(self.site_packages))
+                    installed_marker.write_text(req_hash)
+                    print("✅ Dependencies installed (faster-whisper ready)")
+                    return True
+                except OSError as e:
+                    print(f"⚠️ Could not reuse cached packages: {e}")
+                    try:
+                        self.create_venv(clear=True)
+                    except Exception as e:
+                        print(f"❌ Failed to create venv: {e}")
+                        return False
+
             print("📦 Installing dependencies...")
             try:
-                # Upgrade pip first
-                subprocess.run(
-                    [str(self.venv_pip), "install", "--upgrade", "pip"],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-
-                # Install requirements
-                result = subprocess.run(
-                    [str(self.venv_pip), "install", "-r", str(self.requirements_file)],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
+                uv = shutil.which("uv")
+                if uv:
+                    # uv resolves and downloads in parallel from its own global cache
+                    subprocess.run(
+                        [uv, "pip", "install",
+                         "--python", str(self.venv_python),
+                         "-r", str(self.requirements_file)],
+                        check=True
+                    )
+                else:
+                    # Fill the local wheelhouse, then upgrade pip and install
+                    # requirements offline in a single pip run
+                    self.ensure_pip(req_hash)
+                    self.ensure_wheelhouse(req_hash)
+                    subprocess.run(
+                        [str(self.venv_python), "-m", "pip", "install", "--upgrade",
+                         "--disable-pip-version-check", "--no-compile",
+                         "--no-index", "--find-links", str(self.wheels_dir),
+                         "pip", "-r", str(self.requirements_file)],
+                        check=True
+                    )
+                installed_marker.write_text(req_hash)
+                self.snapshot_packages(golden)
                 print("✅ Dependencies installed (faster-whisper ready)")
                 return True
             except subprocess.CalledProcessError as e:
                 print(f"❌ Failed to install dependencies: {e}")
-                print(f"   Output: {e.output if hasattr(e, 'output') else 'No output'}")
                 return False
         else:
             print("⚠️ No requirements.txt found, skipping dependency installation")
             return True
 
+    def create_venv(self, clear: bool = False) -> None:
+        """Create the venv without pip; uv and cached packages don't need it"""
+        # Symlinking the interpreter avoids copying it, but needs privileges on Windows
+        venv.create(self.venv_dir, clear=clear, with_pip=False, symlinks=os.name != 'nt')
+
+    def ensure_pip(self, req_hash: str) -> None:
+        """Bootstrap pip into the venv from a cached get-pip.py"""
+        if (self.site_packages / "pip").exists():
+            return
+
+        print("📦 Bootstrapping pip...")
+        args = ["--no-setuptools", "--no-wheel", "--disable-pip-version-check"]
+        if self.wheelhouse_ready(req_hash):
+            args += ["--no-index", "--find-links", str(self.wheels_dir)]
+
+        staging = self.get_pip.with_name(f"get-pip.py.tmp{os.getpid()}")
+        try:
+            if not self.get_pip.exists():
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                urllib.request.urlretrieve(GET_PIP_URL, staging)
+                staging.replace(self.get_pip)
+        except OSError as e:
+            # Don't leave a partial download behind in the cache
+            staging.unlink(missing_ok=True)
+            # Offline: fall back to the slower bundled ensurepip
+            print(f"⚠️ Could not download get-pip.py ({e}), using ensurepip")
+            subprocess.run([str(self.venv_python), "-m", "ensurepip"], check=True)
+            return
+
+        subprocess.run([str(self.venv_python), str(self.get_pip)] + args, check=True)
+
+    def requirements_hash(self) -> str:
+        """SHA256 of requirements.txt, used to key cached artifacts"""
+        return hashlib.sha256(self.requirements_file.read_bytes()).hexdigest()
+
+    def ensure_wheelhouse(self, req_hash: str) -> None:
+        """Download wheels into the shared cache unless requirements are unchanged"""
+        if self.wheelhouse_ready(req_hash):
+            return
+
+        print(f"⬇️  Downloading wheels to {self.wheels_dir}")
+        self.wheels_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            [str(self.venv_python), "-m", "pip", "download",
+             "--disable-pip-version-check", "--prefer-binary",
+             "pip", "-r", str(self.requirements_file),
+             "-d", str(self.wheels_dir)],
+            check=True
+        )
+        (self.wheels_dir / ".hash").write_text(req_hash)
+
+    def wheelhouse_ready(self, req_hash: str) -> bool:
+        """Check if the wheelhouse was filled for the current requirements"""
+        hash_file = self.wheels_dir / ".hash"
+        return hash_file.exists() and hash_file.read_text().strip() == req_hash
+
+    def snapshot_packages(self, golden: Path) -> None:
+        """Save site-packages as the golden copy for future installs"""
+        if golden.exists():
+            return
+        staging = golden.with_name(golden.name + f".tmp{os.getpid()}")
+        try:
+            _clone_tree(str(self.site_packages), str(staging))
+            staging.rename(golden)
+        except OSError as e:
+            # The cache is an optimization, never fail the install over it
+            print(f"⚠️ Could not cache packages: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def host_has_dependencies(self) -> bool:
+        """Check if the running interpreter can already import our dependencies"""
+        if sys.version_info < (3, 9):
+            return False
+        return importlib.util.find_spec("faster_whisper") is not None
+
     def is_in_skill_venv(self) -> bool:
         """Check if we're already running in the skill's venv"""
         if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
@@ -98,7 +276,10 @@ def main():
     # Default: ensure environment is set up
     if env.ensure_venv():
         print("\n✅ Environment ready!")
-        print(f"   Virtual env: {env.venv_dir}")
+        if env.uses_host_python:
+            print("   Virtual env: none (using host Python)")
+        else:
+            print(f"   Virtual env: {env.venv_dir}")
         print(f"   Python: {env.get_python_executable()}")
         print(f"\n🚀 You can now run transcriptions:")
         print(f"   python scripts/run.py transcribe.py audio.mp3")
@@ -1,4 +1,8 @@
 #!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.9"
+# dependencies = ["faster-whisper>=1.1.0"]
+# ///
 """
 Faster Whisper Transcription Script
 
@@ -7,35 +11,61 @@ Supports multiple output formats, languages, and GPU acceleration.
 """
 
 import argparse
+import functools
+import itertools
 import json
 import os
+import shutil
 import sys
+import tempfile
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional
 
+from _formatting import format_srt_entry, format_text_line
+
+# Re-exported: these lived here before moving to _formatting
+from _formatting import format_timestamp, format_timestamp_srt  # noqa: F401
+
+# orjson is an optional, much faster serializer for large JSON outputs
 try:
-    from faster_whisper import WhisperModel
-    from tqdm import tqdm
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    print("Error: faster-whisper not installed.")
-    print("Run: pip install faster-whisper")
-    sys.exit(1)
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# Write buffer size for output files
+OUTPUT_BUFSIZE = 1 << 20
+
+# File extension per output format, used when writing multiple files
+OUTPUT_EXTENSIONS = {
+    "text": ".txt",
+    "srt": ".srt",
+    "json": ".json",
+    "json_full": ".json",
+}
 
 
 @dataclass
 class TranscriptionConfig:
     """Configuration for transcription."""
     model_size: str = "large-v3"
-    device: str = "cpu"
-    compute_type: str = "int8"
+    device: str = "auto"
+    compute_type: str = "auto"
     language: Optional[str] = None
     task: str = "transcribe"
     beam_size: int = 5
     vad_filter: bool = False
     vad_parameters: Optional[dict] = None
     word_timestamps: bool = False
+    batch_size: int = 16
+    # Set when "auto" picked CUDA: retry on CPU if the CUDA libraries fail to load
+    cpu_fallback: bool = False
 
     @classmethod
     def from_file(cls, config_path: str) -> "TranscriptionConfig":
@@ -49,50 +79,90 @@ class TranscriptionConfig:
         # Map config keys to dataclass fields
         return cls(
             model_size=data.get("model_size", "large-v3"),
-            device=data.get("device", "cpu"),
-            compute_type=data.get("compute_type", "int8"),
+            device=data.get("device", "auto"),
+            compute_type=data.get("compute_type", "auto"),
             language=data.get("language"),
             task=data.get("task", "transcribe"),
             beam_size=data.get("beam_size", 5),
             vad_filter=data.get("vad_filter", False),
             vad_parameters=data.get("vad_parameters"),
             word_timestamps=data.get("word_timestamps", False),
+            batch_size=data.get("batch_size", 16),
         )
 
+    def resolve_auto(self) -> None:
+        """Replace "auto" device/compute_type with the best this machine supports."""
+        if self.device == "auto":
+            self.device, detected = _autodetect_device_compute()
+            self.cpu_fallback = self.device == "cuda"
+            if self.compute_type == "auto":
+                self.compute_type = detected
+        elif self.compute_type == "auto":
+            self.compute_type = _best_compute_type(self.device)
 
-@dataclass
-class Segment:
+
+def _best_compute_type(device: str) -> str:
+    """Fastest compute type CTranslate2 supports on the given device."""
+    preferred = ("float16", "int8_float16", "int8") if device == "cuda" else ("int8",)
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+    except (ImportError, ValueError, RuntimeError):
+        return preferred[0]
+
+    for compute_type in preferred:
+        if compute_type in supported:
+            return compute_type
+    return "float32"
+
+
+def _autodetect_device_compute() -> tuple[str, str]:
+    """Use CUDA when a GPU is visible, otherwise CPU, with its best compute type."""
+    try:
+        import ctranslate2
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except (ImportError, RuntimeError):
+        device = "cpu"
+    return device, _best_compute_type(device)
+
+
+class Word(NamedTuple):
+    """A single word with timing and confidence."""
+    start: float
+    end: float
+    word: str
+    probability: float
+
+
+class Segment(NamedTuple):
     """A transcribed segment with timing info."""
     start: float
     end: float
     text: str
-    words: Optional[list] = None
+    words: Optional[list[Word]] = None
 
 
 @dataclass
 class TranscriptionResult:
-    """Complete transcription result with metadata."""
+    """Transcription result with metadata; segments are produced lazily."""
     language: str
     language_probability: float
     duration: float
-    segments: list[Segment]
+    segments: Iterable[Segment]
 
 
-def format_timestamp(seconds: float) -> str:
-    """Format timestamp as HH:MM:SS.mmm"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds % 60
-    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
-
+@functools.lru_cache(maxsize=2)
+def _get_model(model_size: str, device: str, compute_type: str):
+    """Load a WhisperModel, reusing it for repeated calls with the same settings."""
+    # Imported lazily so --help and argument errors don't pay for CTranslate2
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        print("Error: faster-whisper not installed.")
+        print("Run: pip install faster-whisper")
+        sys.exit(1)
 
-def format_timestamp_srt(seconds: float) -> str:
-    """Format timestamp as SRT format HH:MM:SS,mmm"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
 
 
 def transcribe(
@@ -111,16 +181,41 @@ def transcribe(
     Returns:
         TranscriptionResult with segments and metadata
     """
+    if not config.cpu_fallback:
+        return _start_transcription(audio_path, config, verbose)
+
+    # A GPU can be visible while cuBLAS/cuDNN are missing; that only shows up
+    # at model load or first decode, so pull the first segment here
+    try:
+        result = _start_transcription(audio_path, config, verbose)
+        segments = iter(result.segments)
+        first = next(segments, None)
+    except RuntimeError as e:
+        print(f"⚠️ CUDA failed ({e}), falling back to CPU", file=sys.stderr)
+        config.device = "cpu"
+        config.compute_type = _best_compute_type("cpu")
+        config.cpu_fallback = False
+        _get_model.cache_clear()
+        return _start_transcription(audio_path, config, verbose)
+
+    if first is not None:
+        segments = itertools.chain((first,), segments)
+    result.segments = segments
+    return result
+
+
+def _start_transcription(
+    audio_path: str,
+    config: TranscriptionConfig,
+    verbose: bool
+) -> TranscriptionResult:
+    """Load the model and start decoding; segments are decoded lazily."""
     if verbose:
         print(f"Loading model: {config.model_size}")
         print(f"Device: {config.device}, Compute: {config.compute_type}")
 
-    # Load model
-    model = WhisperModel(
-        config.model_size,
-        device=config.device,
-        compute_type=config.compute_type,
-    )
+    # Load model (cached across files in the same run)
+    model = _get_model(config.model_size, config.device, config.compute_type)
 
     # Set up VAD parameters
     vad_params = config.vad_parameters if config.vad_filter else None
@@ -135,111 +230,160 @@ def transcribe(
         else:
             print("Language: auto-detect")
 
-    # Transcribe
-    segments_info = model.transcribe(
-        audio_path,
-        language=lang,
-        task=config.task,
-        beam_size=config.beam_size,
-        vad_filter=config.vad_filter,
-        vad_parameters=vad_params,
-        word_timestamps=config.word_timestamps,
-    )
+    # Transcribe; on GPU, decode VAD-cut chunks in batches for throughput.
+    # BatchedInferencePipeline needs faster-whisper 1.1+, older hosts decode sequentially
+    pipeline_cls = None
+    if config.device == "cuda" and config.batch_size > 1:
+        try:
+            from faster_whisper import BatchedInferencePipeline as pipeline_cls
+        except ImportError:
+            if verbose:
+                print("Batched inference unavailable (faster-whisper < 1.1), decoding sequentially")
+
+    if pipeline_cls is not None:
+        if verbose:
+            print(f"Batched inference: batch size {config.batch_size}")
+
+        # The batched pipeline builds its chunks from VAD, so it is always on
+        pipeline = pipeline_cls(model=model)
+        segments_info = pipeline.transcribe(
+            audio_path,
+            language=lang,
+            task=config.task,
+            beam_size=config.beam_size,
+            vad_filter=True,
+            vad_parameters=config.vad_parameters,
+            word_timestamps=config.word_timestamps,
+            batch_size=config.batch_size,
+        )
+    else:
+        segments_info = model.transcribe(
+            audio_path,
+            language=lang,
+            task=config.task,
+            beam_size=config.beam_size,
+            vad_filter=config.vad_filter,
+            vad_parameters=vad_params,
+            word_timestamps=config.word_timestamps,
+        )
 
     segments, info = segments_info
 
-    # Convert to list
-    segment_list = list(segments)
+    return TranscriptionResult(
+        language=info.language,
+        language_probability=float(info.language_probability),
+        duration=float(info.duration),
+        segments=_iter_segments(segments, config.word_timestamps),
+    )
+
 
-    # Build result
-    result_segments = []
-    for seg in segment_list:
+def _iter_segments(segments: Iterable, word_timestamps: bool) -> Iterator[Segment]:
+    """Convert faster-whisper segments as they are decoded."""
+    for seg in segments:
         words = None
-        if config.word_timestamps and hasattr(seg, 'words') and seg.words:
+        if word_timestamps and hasattr(seg, 'words') and seg.words:
             words = [
-                {"start": w.start, "end": w.end, "word": w.word, "probability": w.probability}
+                Word(float(w.start), float(w.end), w.word, float(w.probability))
                 for w in seg.words
             ]
 
-        result_segments.append(Segment(
-            start=seg.start,
-            end=seg.end,
-            text=seg.text.strip(),
-            words=words,
-        ))
+        # faster-whisper may hand back numpy.float64, which orjson rejects
+        yield Segment(float(seg.start), float(seg.end), seg.text.strip(), words)
 
-    return TranscriptionResult(
-        language=info.language,
-        language_probability=info.language_probability,
-        duration=info.duration,
-        segments=result_segments,
-    )
 
+def format_text(result: TranscriptionResult, out: BinaryIO) -> None:
+    """Write plain text with timestamps as UTF-8."""
+    out.write((
+        f"# Transcription\n"
+        f"# Language: {result.language} (confidence: {result.language_probability:.2%})\n"
+        f"# Duration: {result.duration:.1f} seconds\n"
+        f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"\n"
+    ).encode("utf-8"))
 
-def format_text(result: TranscriptionResult) -> str:
-    """Format as plain text with timestamps."""
-    lines = [
-        f"# Transcription",
-        f"# Language: {result.language} (confidence: {result.language_probability:.2%})",
-        f"# Duration: {result.duration:.1f} seconds",
-        f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "",
-    ]
-
+    write = out.write
     for seg in result.segments:
-        lines.append(f"[{seg.start:.2f}s -> {seg.end:.2f}s] {seg.text}")
+        write(format_text_line(seg.start, seg.end, seg.text).encode("utf-8"))
 
-    return "\n".join(lines)
 
+def format_srt(result: TranscriptionResult, out: BinaryIO) -> None:
+    """Write SRT subtitles as UTF-8."""
+    write = out.write
+    for i, seg in enumerate(result.segments, 1):
+        write(format_srt_entry(i, seg.start, seg.end, seg.text).encode("utf-8"))
 
-def format_srt(result: TranscriptionResult) -> str:
-    """Format as SRT subtitles."""
-    lines = []
 
-    for i, seg in enumerate(result.segments, 1):
-        lines.append(str(i))
-        lines.append(f"{format_timestamp_srt(seg.start)} --> {format_timestamp_srt(seg.end)}")
-        lines.append(seg.text)
-        lines.append("")
-
-    return "\n".join(lines)
-
-
-def format_json(result: TranscriptionResult, full: bool = False) -> str:
-    """Format as JSON."""
-    data = {
-        "language": result.language,
-        "language_probability": result.language_probability,
-        "duration": result.duration,
-        "segments": [
-            {
-                "start": seg.start,
-                "end": seg.end,
-                "text": seg.text,
-            }
-            for seg in result.segments
-        ],
-    }
-
-    if full:
-        for i, seg in enumerate(result.segments):
-            if seg.words:
-                data["segments"][i]["words"] = seg.words
-
-    return json.dumps(data, ensure_ascii=False, indent=2)
-
-
-def save_output(content: str, output_path: str) -> None:
-    """Save transcription to file."""
+def format_json(result: TranscriptionResult, out: BinaryIO, full: bool = False) -> None:
+    """Write JSON, emitting each segment as soon as it is available."""
+    header = "{\n"
+    for key in ("language", "language_probability", "duration"):
+        header += f'  "{key}": {json.dumps(getattr(result, key), ensure_ascii=False)},\n'
+    out.write((header + '  "segments": [').encode("utf-8"))
+
+    # Same layout as json.dumps(..., indent=2) without holding every segment
+    separator = b"\n"
+    for seg in result.segments:
+        item = {
+            "start": seg.start,
+            "end": seg.end,
+            "text": seg.text,
+            **({"words": [w._asdict() for w in seg.words]} if full and seg.words else {}),
+        }
+        out.write(separator + b"    " + _dumps(item).replace(b"\n", b"\n    "))
+        separator = b",\n"
+
+    out.write(b"]\n}\n" if separator == b"\n" else b"\n  ]\n}\n")
+
+
+def write_output(result: TranscriptionResult, fmt: str, out: BinaryIO) -> None:
+    """Stream the result to a binary file in the requested format."""
+    if fmt == "srt":
+        format_srt(result, out)
+    elif fmt == "json":
+        format_json(result, out, full=False)
+    elif fmt == "json_full":
+        format_json(result, out, full=True)
+    else:
+        format_text(result, out)
+
+
+def save_output(result: TranscriptionResult, fmt: str, output_path: str) -> None:
+    """Save transcription to file, writing segments as they are decoded."""
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Write beside the target and rename on success, so a decode failure
+    # midway never leaves a truncated output file behind
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp{os.getpid()}")
+    try:
+        # Large buffer so multi-MB outputs reach disk in few write() syscalls
+        with open(tmp_path, "wb", buffering=OUTPUT_BUFSIZE) as f:
+            write_output(result, fmt, f)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     print(f"Saved to: {output_path}")
 
 
+def print_output(result: TranscriptionResult, fmt: str) -> None:
+    """Write transcription to stdout; text/srt stream, JSON is emitted only once complete."""
+    # Bypass the text layer; flush it first to keep output ordered
+    sys.stdout.flush()
+    try:
+        if fmt in ("json", "json_full"):
+            # Spool to disk so a decode failure can't print half a JSON document
+            with tempfile.TemporaryFile() as f:
+                write_output(result, fmt, f)
+                f.seek(0)
+                shutil.copyfileobj(f, sys.stdout.buffer, OUTPUT_BUFSIZE)
+        else:
+            write_output(result, fmt, sys.stdout.buffer)
+    finally:
+        sys.stdout.buffer.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Transcribe audio files using faster-whisper",
@@ -251,44 +395,67 @@ Examples:
   %(prog)s audio.mp3 --output transcript.txt
   %(prog)s audio.mp3 --format srt --output video.srt
   %(prog)s audio.mp3 --model small --device cuda
+  %(prog)s part1.mp3 part2.mp3 --format srt --output subtitles/
         """,
     )
 
-    parser.add_argument("audio_file", help="Path to the audio file to transcribe")
+    parser.add_argument("audio_files", nargs="+", metavar="audio_file",
+                        help="Path(s) to the audio file(s) to transcribe")
 
     parser.add_argument("--config", default="scripts/config.json",
                         help="Path to config file (default: scripts/config.json)")
     parser.add_argument("--model", default=None,
                         choices=["tiny", "base", "small", "medium", "large-v1", "large-v2", "large-v3", "distil-large-v3"],
                         help="Model size (overrides config)")
-    parser.add_argument("--device", choices=["cpu", "cuda"], default=None,
-                        help="Device: cpu or cuda (overrides config)")
+    parser.add_argument("--device", choices=["auto", "cpu", "cuda"], default=None,
+                        help="Device: auto, cpu or cuda (overrides config). auto falls back "
+                             "to CPU if CUDA's cuBLAS/cuDNN libraries are missing")
     parser.add_argument("--compute-type", dest="compute_type",
-                        choices=["float16", "int8", "int8_float16"], default=None,
-                        help="Compute type (overrides config)")
+                        choices=["auto", "float16", "int8", "int8_float16", "int8_bfloat16"], default=None,
+                        help="Compute type (overrides config); int8_bfloat16 needs a CUDA GPU with compute capability 8.0+")
     parser.add_argument("--language", default=None,
                         help="Language code (e.g., en, zh, ja) or 'auto' (overrides config)")
     parser.add_argument("--task", choices=["transcribe", "translate"], default=None,
                         help="Task: transcribe or translate to English")
     parser.add_argument("--beam-size", type=int, dest="beam_size", default=None,
                         help="Beam size for decoding (default: 5)")
+    parser.add_argument("--batch-size", type=int, dest="batch_size", default=None,
+                        help="Batch size for batched GPU inference, 1 disables batching (default: 16)")
     parser.add_argument("--vad-filter", action="store_true", default=None,
                         help="Enable VAD filter to remove silence")
     parser.add_argument("--word-timestamps", action="store_true", default=None,
                         help="Include word-level timestamps")
     parser.add_argument("--output", "-o", default=None,
-                        help="Output file path")
-    parser.add_argument("--format", "fmt", choices=["text", "srt", "json", "json_full"], default="text",
-                        help="Output format (default: text)")
+                        help="Output file path (a directory, required, when transcribing multiple files)")
+    parser.add_argument("--format", choices=["text", "srt", "json", "json_full"], default="text",
+                        help="Output format (default: text). Without --output, text/srt "
+                             "are printed as segments are decoded, so an error midway "
+                             "leaves partial output; JSON is printed only once complete")
     parser.add_argument("--verbose", "-v", action="store_true",
                         help="Show detailed progress")
 
     args = parser.parse_args()
 
-    # Check audio file exists
-    if not os.path.exists(args.audio_file):
-        print(f"Error: Audio file not found: {args.audio_file}")
-        sys.exit(1)
+    # Concatenated results on stdout would be unlabeled (and invalid JSON)
+    if len(args.audio_files) > 1 and not args.output:
+        parser.error("--output DIR is required when transcribing multiple files")
+
+    # Check audio files exist
+    for audio_file in args.audio_files:
+        if not os.path.exists(audio_file):
+            print(f"Error: Audio file not found: {audio_file}")
+            sys.exit(1)
+
+    # Multiple files are written as <output>/<stem><ext>; refuse to overwrite
+    output_paths = {}
+    if args.output and len(args.audio_files) > 1:
+        for audio_file in args.audio_files:
+            output_name = Path(audio_file).stem + OUTPUT_EXTENSIONS[args.format]
+            output_path = str(Path(args.output) / output_name)
+            if output_path in output_paths.values():
+                print(f"Error: Multiple audio files would be saved to {output_path}")
+                sys.exit(1)
+            output_paths[audio_file] = output_path
 
     # Load config
     config = TranscriptionConfig.from_file(args.config)
@@ -306,36 +473,36 @@ Examples:
         config.task = args.task
     if args.beam_size is not None:
         config.beam_size = args.beam_size
+    if args.batch_size is not None:
+        config.batch_size = args.batch_size
     if args.vad_filter is not None:
         config.vad_filter = args.vad_filter
     if args.word_timestamps is not None:
         config.word_timestamps = args.word_timestamps
 
-    # Transcribe
-    try:
-        result = transcribe(args.audio_file, config, verbose=args.verbose)
-    except Exception as e:
-        print(f"Error during transcription: {e}")
+    # Resolve "auto" only after overrides, so e.g. --device cpu picks a CPU compute type
+    config.resolve_auto()
+
+    # Transcribe each file, sharing the loaded model
+    failed = False
+    for audio_file in args.audio_files:
+        # Decoding happens while writing, so errors can surface from either step
+        try:
+            result = transcribe(audio_file, config, verbose=args.verbose)
+
+            if audio_file in output_paths:
+                save_output(result, args.format, output_paths[audio_file])
+            elif args.output:
+                save_output(result, args.format, args.output)
+            else:
+                print_output(result, args.format)
+        except Exception as e:
+            print(f"Error during transcription of {audio_file}: {e}")
+            failed = True
+
+    if failed:
         sys.exit(1)
 
-    # Format output
-    if args.format == "text":
-        output = format_text(result)
-    elif args.format == "srt":
-        output = format_srt(result)
-    elif args.format == "json":
-        output = format_json(result, full=False)
-    elif args.format == "json_full":
-        output = format_json(result, full=True)
-    else:
-        output = format_text(result)
-
-    # Output
-    if args.output:
-        save_output(output, args.output)
-    else:
-        print(output)
-
 
 if __name__ == "__main__":
     main()
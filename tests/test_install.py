@@ -0,0 +1,93 @@
+"""
+Tests for install.py incremental tree sync
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import install  # noqa: E402
+
+
+class TestSyncTree(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.src = Path(self.tmp.name) / "src"
+        self.dst = Path(self.tmp.name) / "dst"
+        self.write(self.src / "run.py", b"print('run')\n")
+        self.write(self.src / "lib" / "helper.py", b"x = 1\n")
+
+    def write(self, path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def test_initial_sync_copies_everything(self):
+        self.assertEqual(install._sync_tree(self.src, self.dst), 2)
+        self.assertEqual((self.dst / "run.py").read_bytes(), b"print('run')\n")
+        self.assertEqual((self.dst / "lib" / "helper.py").read_bytes(), b"x = 1\n")
+
+    def test_dst_only_entries_are_removed(self):
+        install._sync_tree(self.src, self.dst)
+        self.write(self.dst / "stale.py", b"old")
+        self.write(self.dst / "old_dir" / "nested.py", b"old")
+
+        install._sync_tree(self.src, self.dst)
+
+        self.assertFalse((self.dst / "stale.py").exists())
+        self.assertFalse((self.dst / "old_dir").exists())
+
+    def test_file_replaced_by_directory(self):
+        self.write(self.dst / "lib", b"was a file")
+
+        install._sync_tree(self.src, self.dst)
+
+        self.assertTrue((self.dst / "lib").is_dir())
+        self.assertEqual((self.dst / "lib" / "helper.py").read_bytes(), b"x = 1\n")
+
+    def test_directory_replaced_by_file(self):
+        self.write(self.dst / "run.py" / "inner.py", b"was a dir")
+
+        install._sync_tree(self.src, self.dst)
+
+        self.assertTrue((self.dst / "run.py").is_file())
+        self.assertEqual((self.dst / "run.py").read_bytes(), b"print('run')\n")
+
+    def test_unchanged_file_is_not_rewritten(self):
+        install._sync_tree(self.src, self.dst)
+        target = self.dst / "run.py"
+        before = target.stat()
+        # Same size and mtime but different bytes: only a rewrite would restore them
+        target.write_bytes(b"print('RUN')\n")
+        os.utime(target, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        self.assertEqual(install._sync_tree(self.src, self.dst), 0)
+        self.assertEqual(target.read_bytes(), b"print('RUN')\n")
+        self.assertEqual(target.stat().st_mtime_ns, before.st_mtime_ns)
+
+    def test_changed_size_is_recopied(self):
+        install._sync_tree(self.src, self.dst)
+        self.write(self.src / "run.py", b"print('run again')\n")
+
+        self.assertEqual(install._sync_tree(self.src, self.dst), 1)
+        self.assertEqual((self.dst / "run.py").read_bytes(), b"print('run again')\n")
+
+    def test_changed_mtime_is_recopied(self):
+        install._sync_tree(self.src, self.dst)
+        source = self.src / "run.py"
+        source.write_bytes(b"print('RUN')\n")
+        st = source.stat()
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(install._sync_tree(self.src, self.dst), 1)
+        self.assertEqual((self.dst / "run.py").read_bytes(), b"print('RUN')\n")
+        self.assertEqual((self.dst / "run.py").stat().st_mtime_ns, source.stat().st_mtime_ns)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Tests for transcribe.py output handling
+Run with: python -m unittest discover tests
+"""
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import transcribe  # noqa: E402
+
+
+class Float64(float):
+    """Stand-in for numpy.float64, a float subclass orjson refuses to serialize"""
+
+
+def fake_segment(start, end, text, words):
+    words = [
+        SimpleNamespace(start=Float64(s), end=Float64(e), word=w, probability=Float64(p))
+        for s, e, w, p in words
+    ]
+    return SimpleNamespace(start=Float64(start), end=Float64(end), text=text, words=words)
+
+
+class TestJsonOutput(unittest.TestCase):
+    def make_result(self):
+        segments = [
+            fake_segment(0.0, 1.5, " Hello world ", [(0.0, 0.6, " Hello", 0.9), (0.6, 1.5, " world", 0.8)]),
+            fake_segment(1.5, 2.25, " 你好 ", [(1.5, 2.25, " 你好", 0.95)]),
+        ]
+        return transcribe.TranscriptionResult(
+            language="en",
+            language_probability=0.97,
+            duration=2.25,
+            segments=transcribe._iter_segments(segments, word_timestamps=True),
+        )
+
+    def test_iter_segments_converts_float_subclasses(self):
+        seg = next(iter(self.make_result().segments))
+        self.assertIs(type(seg.start), float)
+        self.assertIs(type(seg.words[0].probability), float)
+
+    def test_json_full_with_float_subclasses(self):
+        out = io.BytesIO()
+        transcribe.format_json(self.make_result(), out, full=True)
+        data = json.loads(out.getvalue().decode("utf-8"))
+
+        self.assertEqual(len(data["segments"]), 2)
+        self.assertEqual(data["segments"][0]["text"], "Hello world")
+        self.assertEqual(data["segments"][1]["words"][0]["word"], " 你好")
+        self.assertEqual(data["segments"][0]["words"][1]["probability"], 0.8)
+
+
+class TestSaveOutput(unittest.TestCase):
+    def test_failed_decode_leaves_no_file(self):
+        def segments():
+            yield fake_segment(0.0, 1.0, " Hello", [])
+            raise RuntimeError("decode failed")
+
+        result = transcribe.TranscriptionResult(
+            language="en",
+            language_probability=0.97,
+            duration=2.0,
+            segments=transcribe._iter_segments(segments(), word_timestamps=False),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(RuntimeError):
+                transcribe.save_output(result, "srt", str(Path(tmp) / "out.srt"))
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+
+
+class TestCpuFallback(unittest.TestCase):
+    def start(self, audio_path, config, verbose):
+        def segments():
+            if config.device == "cuda":
+                raise RuntimeError("Library libcublas.so.12 is not found")
+            yield fake_segment(0.0, 1.0, " Hello", [])
+
+        return transcribe.TranscriptionResult(
+            language="en",
+            language_probability=0.97,
+            duration=1.0,
+            segments=transcribe._iter_segments(segments(), word_timestamps=False),
+        )
+
+    def run_transcribe(self, config):
+        with mock.patch.object(transcribe, "_start_transcription", self.start), \
+                mock.patch("sys.stderr", io.StringIO()):
+            return transcribe.transcribe("a.mp3", config)
+
+    def test_auto_selected_cuda_falls_back_to_cpu(self):
+        config = transcribe.TranscriptionConfig(device="cuda", compute_type="float16", cpu_fallback=True)
+        result = self.run_transcribe(config)
+
+        self.assertEqual([seg.text for seg in result.segments], ["Hello"])
+        self.assertEqual(config.device, "cpu")
+        self.assertFalse(config.cpu_fallback)
+
+    def test_explicit_cuda_does_not_fall_back(self):
+        config = transcribe.TranscriptionConfig(device="cuda", compute_type="float16")
+        result = self.run_transcribe(config)
+
+        with self.assertRaises(RuntimeError):
+            list(result.segments)
+        self.assertEqual(config.device, "cuda")
+
+
+if __name__ == "__main__":
+    unittest.main()